@@ -1,6 +1,37 @@
 """Common data structures for LeetCode problems."""
 
-from .list_node import ListNode
-from .tree_node import TreeNode
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["ListNode", "TreeNode"]
+if TYPE_CHECKING:
+    from .array_tree import ArrayTree
+    from .list_node import ListNode
+    from .soa_list import ArrayListNode, ListPool
+    from .tree_node import TreeNode
+
+__all__ = ["ArrayListNode", "ArrayTree", "ListNode", "ListPool", "TreeNode"]
+
+# Submodule defining each export; loaded on first access so that importing
+# one structure doesn't import the others
+_EXPORTS = {
+    "ArrayListNode": ".soa_list",
+    "ArrayTree": ".array_tree",
+    "ListNode": ".list_node",
+    "ListPool": ".soa_list",
+    "TreeNode": ".tree_node",
+}
+
+
+def __getattr__(name: str):
+    """Import an exported structure on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not-yet-loaded exports."""
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,108 @@
+"""Binary tree stored in a flat level-order (Eytzinger) array."""
+
+
+class ArrayTree:
+    """
+    Binary tree laid out in a single list.
+
+    The root lives at index 0 and the children of node ``i`` at ``2i + 1``
+    and ``2i + 2``; missing nodes are ``None``. Traversals index one flat
+    list instead of following child pointers.
+
+    Note:
+        Index space grows with depth, so a deep, sparse tree (e.g. a long
+        chain) needs up to ``2**depth`` slots. Prefer TreeNode for those.
+    """
+
+    __slots__ = ("_nodes",)
+
+    def __init__(self, nodes: list[int | None] | None = None):
+        self._nodes = nodes or []
+
+    def __len__(self) -> int:
+        """Number of slots in the underlying array, including gaps."""
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        """String representation of the tree."""
+        return f"ArrayTree({self.to_list()})"
+
+    def _present(self, i: int) -> int | None:
+        """Return ``i`` if it holds a node, otherwise None."""
+        if i < len(self._nodes) and self._nodes[i] is not None:
+            return i
+        return None
+
+    @property
+    def root(self) -> int | None:
+        """Index of the root node, or None for an empty tree."""
+        return self._present(0)
+
+    def val(self, i: int) -> int | None:
+        """Value of node ``i``."""
+        return self._nodes[i]
+
+    def left(self, i: int) -> int | None:
+        """Index of the left child of node ``i``, or None if absent."""
+        return self._present(2 * i + 1)
+
+    def right(self, i: int) -> int | None:
+        """Index of the right child of node ``i``, or None if absent."""
+        return self._present(2 * i + 2)
+
+    @classmethod
+    def from_list(cls, values: list[int | None]) -> "ArrayTree":
+        """
+        Create a tree from LeetCode's level-order list representation.
+
+        LeetCode omits the children of missing nodes, so positions are
+        remapped onto the ``2i + 1`` / ``2i + 2`` layout. For complete trees
+        the input is stored as-is.
+        """
+        if not values or values[0] is None:
+            return cls()
+        if None not in values:
+            return cls(list(values))
+
+        nodes: list[int | None] = [values[0]]
+        parents = [0]  # Array indices of nodes still waiting for children
+        p = 0
+        i = 1
+
+        while p < len(parents) and i < len(values):
+            slot = 2 * parents[p] + 1
+            for child in (slot, slot + 1):
+                if i < len(values) and values[i] is not None:
+                    if child >= len(nodes):
+                        nodes.extend([None] * (child + 1 - len(nodes)))
+                    nodes[child] = values[i]
+                    parents.append(child)
+                i += 1
+            p += 1
+
+        return cls(nodes)
+
+    def to_list(self) -> list[int | None]:
+        """Convert tree to LeetCode's level-order list representation."""
+        if self.root is None:
+            return []
+
+        result = []
+        level = [0]
+
+        while level:
+            next_level = []
+            for i in level:
+                if self._present(i) is None:
+                    result.append(None)
+                else:
+                    result.append(self._nodes[i])
+                    next_level.append(2 * i + 1)
+                    next_level.append(2 * i + 2)
+            level = next_level
+
+        # Remove trailing None values
+        while result and result[-1] is None:
+            result.pop()
+
+        return result
@@ -1,11 +1,36 @@
 """Definition for singly-linked list node."""
 
+import threading
 from typing import Optional
 
+# Traversal cap for repr/to_list so a cyclic list cannot loop forever
+MAX_NODES = 100
+
+# Maximum number of released nodes kept for reuse
+POOL_LIMIT = 1 << 16
+
+# Nodes returned by ListNode.release(), reused by ListNode.from_list(); each
+# thread has its own pool, so concurrent builds never pop from a shared one
+_pools = threading.local()
+
+# Placed in val of released nodes so a node is never pooled twice
+_RELEASED = object()
+
+
+def _free_nodes() -> list["ListNode"]:
+    """Return the calling thread's pool of released nodes."""
+    try:
+        return _pools.nodes
+    except AttributeError:
+        _pools.nodes = []
+        return _pools.nodes
+
 
 class ListNode:
     """Singly-linked list node."""
 
+    __slots__ = ("val", "next")
+
     def __init__(self, val: int = 0, next: Optional["ListNode"] = None):
         self.val = val
         self.next = next
@@ -13,13 +38,15 @@ class ListNode:
     def __repr__(self) -> str:
         """String representation of the linked list."""
         vals = []
+        append = vals.append
         current = self
-        while current:
-            vals.append(str(current.val))
-            current = current.next
-            if len(vals) > 100:  # Prevent infinite loops
-                vals.append("...")
+        for _ in range(MAX_NODES):
+            if current is None:
                 break
+            append(str(current.val))
+            current = current.next
+        if current is not None:
+            append("...")
         return " -> ".join(vals)
 
     @classmethod
@@ -28,20 +55,45 @@ class ListNode:
         if not values:
             return None
 
-        head = cls(values[0])
-        current = head
-        for val in values[1:]:
-            current.next = cls(val)
-            current = current.next
+        # Released nodes already have next=None, so only val needs resetting
+        free = _free_nodes() if cls is ListNode else []
+        it = iter(values)
+        head = current = cls(next(it))
+        for val in it:
+            if free:
+                node = free.pop()
+                node.val = val
+            else:
+                node = cls(val)
+            current.next = current = node
         return head
 
+    @staticmethod
+    def release(head: Optional["ListNode"]):
+        """
+        Return every node of a list to the free pool.
+
+        Later from_list() calls reuse pooled nodes instead of allocating.
+        The released nodes must not be used afterwards. Useful in benchmark
+        loops that build and discard many lists.
+        """
+        pool = _free_nodes()
+        while head is not None and head.val is not _RELEASED:
+            nxt = head.next
+            head.val = _RELEASED
+            head.next = None
+            if type(head) is ListNode and len(pool) < POOL_LIMIT:
+                pool.append(head)
+            head = nxt
+
     def to_list(self) -> list[int]:
         """Convert linked list to Python list."""
         result = []
+        append = result.append
         current = self
-        while current:
-            result.append(current.val)
-            current = current.next
-            if len(result) > 100:  # Prevent infinite loops
+        for _ in range(MAX_NODES):
+            if current is None:
                 break
+            append(current.val)
+            current = current.next
         return result
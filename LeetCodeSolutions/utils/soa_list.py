@@ -0,0 +1,113 @@
+"""Array-backed singly-linked list for bulk workloads."""
+
+from array import array
+from typing import Optional
+
+from .list_node import MAX_NODES
+
+# Index stored in ``nexts`` for the last node of a list
+NIL = -1
+
+
+class ListPool:
+    """
+    Storage for many linked-list nodes in two parallel arrays.
+
+    Node ``i`` holds its value in ``vals[i]`` and the index of its successor
+    in ``nexts[i]`` (``NIL`` for the tail), so a traversal walks two flat
+    buffers instead of chasing one Python object per node.
+    """
+
+    __slots__ = ("vals", "nexts")
+
+    def __init__(self):
+        self.vals = array("q")
+        self.nexts = array("i")
+
+    def __len__(self) -> int:
+        """Number of nodes allocated in the pool."""
+        return len(self.vals)
+
+    @classmethod
+    def from_list(cls, values: list[int]) -> "ListPool":
+        """Create a pool holding ``values`` as one list starting at index 0."""
+        pool = cls()
+        pool.vals.extend(values)
+        n = len(pool.vals)
+        pool.nexts = array("i", range(1, n + 1))
+        if n:
+            pool.nexts[-1] = NIL
+        return pool
+
+    @property
+    def head(self) -> Optional["ArrayListNode"]:
+        """View of the first node, or None for an empty pool."""
+        return ArrayListNode(self, 0) if self.vals else None
+
+    def new_node(self, val: int = 0) -> "ArrayListNode":
+        """Allocate a detached node and return a view of it."""
+        self.vals.append(val)
+        self.nexts.append(NIL)
+        return ArrayListNode(self, len(self.vals) - 1)
+
+
+class ArrayListNode:
+    """
+    ListNode-compatible view of one node in a ListPool.
+
+    Views are created on demand, so compare nodes with ``==`` rather than
+    ``is`` (e.g. in cycle detection).
+    """
+
+    __slots__ = ("pool", "idx")
+
+    def __init__(self, pool: ListPool, idx: int):
+        self.pool = pool
+        self.idx = idx
+
+    @property
+    def val(self) -> int:
+        """Value stored in this node."""
+        return self.pool.vals[self.idx]
+
+    @val.setter
+    def val(self, value: int):
+        self.pool.vals[self.idx] = value
+
+    @property
+    def next(self) -> Optional["ArrayListNode"]:
+        """View of the next node, or None at the tail."""
+        nxt = self.pool.nexts[self.idx]
+        return None if nxt == NIL else ArrayListNode(self.pool, nxt)
+
+    @next.setter
+    def next(self, node: Optional["ArrayListNode"]):
+        if node is not None and node.pool is not self.pool:
+            raise ValueError("Cannot link nodes from different pools")
+        self.pool.nexts[self.idx] = NIL if node is None else node.idx
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayListNode):
+            return NotImplemented
+        return self.pool is other.pool and self.idx == other.idx
+
+    def __hash__(self) -> int:
+        return hash((id(self.pool), self.idx))
+
+    def __repr__(self) -> str:
+        """String representation of the linked list."""
+        return " -> ".join(str(val) for val in self.to_list())
+
+    def to_list(self) -> list[int]:
+        """Convert linked list to Python list."""
+        vals = self.pool.vals
+        nexts = self.pool.nexts
+        result = []
+        append = result.append
+        idx = self.idx
+        for _ in range(MAX_NODES):
+            if idx == NIL:
+                break
+            append(vals[idx])
+            idx = nexts[idx]
+        return result
@@ -1,12 +1,13 @@
 """Definition for binary tree node."""
 
-from collections import deque
 from typing import Optional
 
 
 class TreeNode:
     """Binary tree node."""
 
+    __slots__ = ("val", "left", "right")
+
     def __init__(
         self,
         val: int = 0,
@@ -37,43 +38,54 @@ class TreeNode:
         if not values or values[0] is None:
             return None
 
-        root = cls(values[0])
-        queue = deque([root])
-        i = 1
-
-        while queue and i < len(values):
-            node = queue.popleft()
-
-            # Left child
-            if i < len(values) and values[i] is not None:
-                node.left = cls(values[i])
-                queue.append(node.left)
-            i += 1
+        if None not in values:
+            # Complete tree: the children of node i sit at 2i+1 and 2i+2
+            nodes = [cls(val) for val in values]
+            for parent, left in zip(nodes, nodes[1::2], strict=False):
+                parent.left = left
+            for parent, right in zip(nodes, nodes[2::2], strict=False):
+                parent.right = right
+            return nodes[0]
 
-            # Right child
-            if i < len(values) and values[i] is not None:
-                node.right = cls(values[i])
-                queue.append(node.right)
-            i += 1
+        root = cls(values[0])
+        # Live nodes in level order; the k-th one owns positions 2k+1 and 2k+2
+        nodes = [root]
+        add_node = nodes.append
+
+        for i in range(1, len(values)):
+            val = values[i]
+            if val is None:
+                continue
+
+            parent_pos = (i - 1) >> 1
+            if parent_pos >= len(nodes):
+                break  # More values than open child slots
+
+            node = cls(val)
+            if i & 1:
+                nodes[parent_pos].left = node
+            else:
+                nodes[parent_pos].right = node
+            add_node(node)
 
         return root
 
     def to_list(self) -> list[int | None]:
         """Convert tree to level-order list representation."""
-        if not self:
-            return []
-
+        # Iterating a list that is appended to while looping visits nodes in
+        # level order, so a plain list stands in for a queue
+        nodes = [self]
         result = []
-        queue = deque([self])
-
-        while queue:
-            node = queue.popleft()
-            if node:
-                result.append(node.val)
-                queue.append(node.left)
-                queue.append(node.right)
+        add_node = nodes.append
+        emit = result.append
+
+        for node in nodes:
+            if node is None:
+                emit(None)
             else:
-                result.append(None)
+                emit(node.val)
+                add_node(node.left)
+                add_node(node.right)
 
         # Remove trailing None values
         while result and result[-1] is None:
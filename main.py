@@ -1,18 +1,25 @@
 """LeetCoder - Automated LeetCode problem tracker and solution manager."""
 
+from __future__ import annotations
+
 import argparse
+import shutil
+import sys
+from typing import TYPE_CHECKING
+
+# Rich and the src modules are imported where they are used, so `--help`
+# and argument errors don't pay for loading them.
+if TYPE_CHECKING:
+    from pathlib import Path
 
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+    from rich.console import Console
+    from rich.table import Table
 
-from src.database import Database
-from src.leetcode_api import LeetCodeAPI
-from src.problem_index import ProblemIndex
-from src.solution_generator import SolutionGenerator
+    from src.leetcode_api import LeetCodeAPI
+    from src.problem_index import ProblemIndex
+    from src.solution_generator import SolutionGenerator
 
-console = Console(force_terminal=True, legacy_windows=False)
+_console: Console | None = None
 
 # Difficulty color mapping
 DIFFICULTY_COLORS = {
@@ -21,10 +28,46 @@ DIFFICULTY_COLORS = {
     "Hard": "red",
 }
 
+# Pre-rendered markup per difficulty, so table rows need only a dict lookup
+DIFFICULTY_MARKUP = {
+    difficulty: f"[{color}]{difficulty}[/{color}]"
+    for difficulty, color in DIFFICULTY_COLORS.items()
+}
+
+
+def get_console() -> Console:
+    """Get the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Output is tables and fixed markup: skip the per-print highlighter
+        # and emoji passes, and measure the terminal once up front
+        _console = Console(
+            force_terminal=True,
+            legacy_windows=False,
+            highlight=False,
+            emoji=False,
+            width=shutil.get_terminal_size((120, 40)).columns,
+        )
+    return _console
+
+
+def print_buffered(*renderables):
+    """
+    Render several items and write them to stdout in one call.
+
+    Large tables otherwise reach the terminal as many small writes.
 
-def get_difficulty_color(difficulty: str) -> str:
-    """Get color for difficulty level."""
-    return DIFFICULTY_COLORS.get(difficulty, "white")
+    Args:
+        renderables: Objects or markup strings accepted by Console.print
+    """
+    console = get_console()
+    with console.capture() as capture:
+        for renderable in renderables:
+            console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
 
 
 def create_problem_table(problems: list[dict], title: str, show_filename: bool = False) -> Table:
@@ -39,6 +82,9 @@ def create_problem_table(problems: list[dict], title: str, show_filename: bool =
     Returns:
         Rich Table object
     """
+    from rich import box
+    from rich.table import Table
+
     table = Table(title=title, box=box.ROUNDED)
     table.add_column("ID", justify="right", style="cyan")
     table.add_column("Title", style="white")
@@ -48,84 +94,87 @@ def create_problem_table(problems: list[dict], title: str, show_filename: bool =
     if show_filename:
         table.add_column("File", style="blue")
 
-    for problem in problems:
-        difficulty_color = get_difficulty_color(problem["difficulty"])
-        tags_display = ", ".join(problem["tags"][:3]) + ("..." if len(problem["tags"]) > 3 else "")
+    # Bind per-row callables once; this loop runs for every listed problem
+    add_row = table.add_row
+    difficulty_markup = DIFFICULTY_MARKUP.get
 
-        row = [
-            str(problem["id"]),
+    for problem in problems:
+        difficulty = problem["difficulty"]
+        row = (
+            f"{problem['id']}",
             problem["title"],
-            f"[{difficulty_color}]{problem['difficulty']}[/{difficulty_color}]",
-            tags_display,
-        ]
+            difficulty_markup(difficulty, difficulty),
+            problem["tags_display"],
+        )
 
         if show_filename:
-            row.append(problem["filename"])
+            row += (problem["filename"],)
 
-        table.add_row(*row)
+        add_row(*row)
 
     return table
 
 
-def resolve_problem(pid: str, index: ProblemIndex, api: LeetCodeAPI) -> dict | None:
+def resolve_problems(
+    pids: list[str], index: ProblemIndex, api: LeetCodeAPI
+) -> dict[str, dict | None]:
     """
-    Resolve problem by ID or slug, trying local database first, then API.
+    Resolve problems by ID or slug, trying local database first, then API.
+
+    Local hits are read with one query per key type, and all misses are
+    fetched from LeetCode in a single batched request.
 
     Args:
-        pid: Problem ID (as string) or slug
+        pids: Problem IDs (as strings) or slugs
         index: Problem index manager
         api: LeetCode API client
 
     Returns:
-        Problem data dictionary or None if not found
+        Dictionary mapping each pid to its problem data, or None if not found
     """
-    # Check if it's a numeric ID or slug
-    if pid.isdigit():
-        problem_id = int(pid)
-        problem_data = index.get_problem(problem_id)
-        if problem_data:
-            return problem_data
+    console = get_console()
+
+    ids = {pid: int(pid) for pid in pids if pid.isdigit()}
+    slugs = [pid for pid in pids if pid not in ids]
 
+    by_id = index.get_problems(list(ids.values()))
+    by_slug = index.get_problems_by_slugs(slugs)
+
+    missing_ids = [i for i in dict.fromkeys(ids.values()) if i not in by_id]
+    missing_slugs = [s for s in dict.fromkeys(slugs) if s not in by_slug]
+
+    if missing_ids or missing_slugs:
         # Not in local database, try API
+        labels = [str(i) for i in missing_ids] + [f"'{s}'" for s in missing_slugs]
         console.print(
-            f"[yellow][!] Problem {problem_id} not in local database. "
+            f"[yellow][!] Problem(s) {', '.join(labels)} not in local database. "
             f"Fetching from LeetCode...[/yellow]"
         )
-        return api.get_problem_by_id(problem_id)
-
-    # It's a slug
-    problem_data = index.db.get_problem_by_slug(pid)
-    if problem_data:
-        return problem_data
+        # IDs are mapped to slugs first so both kinds go out in one request
+        id_slugs = api.get_slugs_by_ids(missing_ids)
+        fetched = api.get_problems_by_slugs(missing_slugs + list(id_slugs.values()))
+        by_id.update({i: fetched[s] for i, s in id_slugs.items() if s in fetched})
+        by_slug.update({s: fetched[s] for s in missing_slugs if s in fetched})
 
-    # Not in local database, try API
-    console.print(
-        f"[yellow][!] Problem '{pid}' not in local database. "
-        f"Fetching from LeetCode...[/yellow]"
-    )
-    return api.get_problem_by_slug(pid)
+    return {pid: by_id.get(ids[pid]) if pid in ids else by_slug.get(pid) for pid in pids}
 
 
-def add_single_problem(
-    pid: str,
-    api: LeetCodeAPI,
-    generator: SolutionGenerator,
-    index: ProblemIndex,
+def report_add_result(
+    pid: str, problem_data: dict | None, result: Path | BaseException | None
 ) -> bool:
     """
-    Add a single problem.
+    Print the outcome of adding a single problem.
 
     Args:
-        pid: Problem ID or slug
-        api: LeetCode API client
-        generator: Solution file generator
-        index: Problem index manager
+        pid: Problem ID or slug, as given on the command line
+        problem_data: Resolved problem data, or None if not found
+        result: Generated file, the error raised generating it, or None if
+            the problem was already added
 
     Returns:
-        True if successfully added, False otherwise
+        True if the problem was added, False otherwise
     """
-    # Resolve problem from database or API
-    problem_data = resolve_problem(pid, index, api)
+    console = get_console()
 
     if not problem_data:
         console.print(f"[red][X] Problem '{pid}' not found[/red]")
@@ -134,19 +183,16 @@ def add_single_problem(
         )
         return False
 
-    # Check if already exists
-    if index.problem_exists(problem_data["id"]):
+    if result is None:
         console.print(
             f"[yellow][!] Problem {problem_data['id']} ({problem_data['title']}) "
             f"already exists[/yellow]"
         )
         return False
 
-    # Generate solution file
-    filepath = generator.generate_solution_file(problem_data)
-
-    # Add to index
-    index.add_problem(problem_data, filepath.name)
+    if isinstance(result, BaseException):
+        console.print(f"[red][X] Error adding problem '{pid}': {result}[/red]")
+        return False
 
     console.print(
         f"[green][OK] Added: {problem_data['id']}. {problem_data['title']} "
@@ -170,11 +216,39 @@ def add_problem(
         generator: Solution file generator
         index: Problem index manager
     """
+    console = get_console()
+
+    try:
+        resolved = resolve_problems(problem_ids, index, api)
+    except Exception as e:
+        console.print(f"[red][X] Error resolving problems: {e}[/red]")
+        return
+
+    # One existence query up front; each new problem is generated once, even
+    # if it was given several times
+    existing = index.get_existing_ids([data["id"] for data in resolved.values() if data])
+    new = {}
     for pid in problem_ids:
-        try:
-            add_single_problem(pid, api, generator, index)
-        except Exception as e:
-            console.print(f"[red][X] Error adding problem '{pid}': {e}[/red]")
+        data = resolved[pid]
+        if data and data["id"] not in existing and data["id"] not in new:
+            new[data["id"]] = data
+
+    # Files are written concurrently; a problem that fails doesn't affect
+    # the others
+    results = dict(zip(new, generator.generate_many(list(new.values())), strict=True))
+
+    # Outcomes are reported in command-line order. Once a problem is reported
+    # as added, later mentions of it report it as existing
+    added: list[tuple[int, str]] = []
+    for pid in problem_ids:
+        data = resolved[pid]
+        result = results.get(data["id"]) if data else None
+        if report_add_result(pid, data, result):
+            added.append((data["id"], result.name))
+            del results[data["id"]]
+
+    # One index write for the whole batch
+    index.add_problems(added)
 
 
 def search_problems(keyword: str, index: ProblemIndex, search_by_tag: bool = False):
@@ -186,6 +260,7 @@ def search_problems(keyword: str, index: ProblemIndex, search_by_tag: bool = Fal
         index: Problem index manager
         search_by_tag: If True, search by tag instead of title
     """
+    console = get_console()
     if search_by_tag:
         results = index.search_by_tag(keyword)
         search_type = "tag"
@@ -198,8 +273,7 @@ def search_problems(keyword: str, index: ProblemIndex, search_by_tag: bool = Fal
         return
 
     table = create_problem_table(results, f"Search Results: '{keyword}'")
-    console.print(table)
-    console.print(f"\nFound {len(results)} problem(s)")
+    print_buffered(table, f"\nFound {len(results)} problem(s)")
 
 
 def list_problems(index: ProblemIndex):
@@ -209,6 +283,7 @@ def list_problems(index: ProblemIndex):
     Args:
         index: Problem index manager
     """
+    console = get_console()
     problems = index.get_all_problems()
 
     if not problems:
@@ -216,8 +291,7 @@ def list_problems(index: ProblemIndex):
         return
 
     table = create_problem_table(problems, "All Problems", show_filename=True)
-    console.print(table)
-    console.print(f"\nTotal: {len(problems)} problem(s)")
+    print_buffered(table, f"\nTotal: {len(problems)} problem(s)")
 
 
 def show_statistics(index: ProblemIndex):
@@ -227,6 +301,11 @@ def show_statistics(index: ProblemIndex):
     Args:
         index: Problem index manager
     """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = get_console()
     stats = index.get_statistics()
 
     if stats["total"] == 0:
@@ -242,11 +321,11 @@ def show_statistics(index: ProblemIndex):
         diff_table.add_column("Difficulty", style="white")
         diff_table.add_column("Count", justify="right", style="cyan")
 
-        for difficulty in ["Easy", "Medium", "Hard"]:
+        # DIFFICULTY_MARKUP is ordered Easy -> Hard, matching the table order
+        for difficulty, markup in DIFFICULTY_MARKUP.items():
             count = stats["by_difficulty"].get(difficulty, 0)
             if count > 0:
-                color = get_difficulty_color(difficulty)
-                diff_table.add_row(f"[{color}]{difficulty}[/{color}]", str(count))
+                diff_table.add_row(markup, str(count))
 
         console.print(diff_table)
 
@@ -270,6 +349,9 @@ def sync_database(api: LeetCodeAPI, force: bool = False):
         api: LeetCode API client
         force: If True, re-sync all problems (not just new ones)
     """
+    from src.database import Database
+
+    console = get_console()
     db = Database()
 
     # Check current status
@@ -357,22 +439,29 @@ Workflow:
         parser.print_help()
         return
 
-    # Initialize components
-    api = LeetCodeAPI()
-    generator = SolutionGenerator()
+    # Initialize only the components the command needs
+    if args.command == "sync":
+        from src.leetcode_api import LeetCodeAPI
+
+        sync_database(LeetCodeAPI(), force=args.force)
+        return
+
+    from src.problem_index import ProblemIndex
+
     index = ProblemIndex()
 
     # Execute command
     if args.command == "add":
-        add_problem(args.problems, api, generator, index)
+        from src.leetcode_api import LeetCodeAPI
+        from src.solution_generator import SolutionGenerator
+
+        add_problem(args.problems, LeetCodeAPI(), SolutionGenerator(), index)
     elif args.command == "search":
         search_problems(args.keyword, index, search_by_tag=args.tag)
     elif args.command == "list":
         list_problems(index)
     elif args.command == "stats":
         show_statistics(index)
-    elif args.command == "sync":
-        sync_database(api, force=args.force)
 
 
 if __name__ == "__main__":
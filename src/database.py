@@ -1,10 +1,96 @@
 """SQLite database management for LeetCode problems."""
 
-import json
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
+
+# Number of tags kept in the pre-rendered tags_display column
+TAGS_DISPLAY_LIMIT = 3
+
+# Shortest keyword the trigram full-text index can match; shorter ones use LIKE
+FTS_MIN_CHARS = 3
+
+# Prepared statements kept per connection by the sqlite3 module
+STATEMENT_CACHE_SIZE = 512
+
+# Page cache size in KiB (negative cache_size means KiB, not pages)
+PAGE_CACHE_KIB = 65536
+
+# WAL pages written before SQLite checkpoints them into the database file
+WAL_AUTOCHECKPOINT_PAGES = 1000
+
+# Statements are kept as constants so repeated calls hit the statement cache.
+# Lists of IDs or slugs are bound as one JSON array instead of a variable
+# number of placeholders, so every list length shares a single statement
+
+# Column order matches Database._problem_params()
+UPSERT_PROBLEM_SQL = """
+    INSERT OR REPLACE INTO problems
+    (id, title, slug, difficulty, content, code_snippet, tags, hints, url, synced_at,
+     tags_display)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Rows per multi-row upsert statement; 50 rows x 11 columns stays below the
+# 999 bound-parameter limit of older SQLite builds
+UPSERT_CHUNK_ROWS = 50
+
+# Every stored problem field, for callers that need the full record
+PROBLEM_COLUMNS = (
+    "id, title, slug, difficulty, content, code_snippet, tags, hints, url, synced_at, tags_display"
+)
+
+# Columns needed to list search results; leaves out content, code and hints
+PROBLEM_SUMMARY_COLUMNS = "p.id, p.title, p.slug, p.difficulty, p.tags_display, p.url"
+
+# Columns needed to list added problems
+ADDED_SUMMARY_COLUMNS = "p.id, p.title, p.slug, p.difficulty, p.tags_display, a.filename"
+
+SELECT_PROBLEM_SQL = f"SELECT {PROBLEM_COLUMNS} FROM problems WHERE id = ?"
+
+SELECT_PROBLEM_BY_SLUG_SQL = f"SELECT {PROBLEM_COLUMNS} FROM problems WHERE slug = ?"
+
+SELECT_PROBLEMS_BY_IDS_SQL = (
+    f"SELECT {PROBLEM_COLUMNS} FROM problems WHERE id IN (SELECT value FROM json_each(?))"
+)
+
+SELECT_PROBLEMS_BY_SLUGS_SQL = (
+    f"SELECT {PROBLEM_COLUMNS} FROM problems WHERE slug IN (SELECT value FROM json_each(?))"
+)
+
+SELECT_ADDED_SUMMARIES_SQL = f"""
+    SELECT {ADDED_SUMMARY_COLUMNS}
+    FROM added_problems a
+    JOIN problems p ON p.id = a.id
+    ORDER BY a.id
+    LIMIT ? OFFSET ?
+"""
+
+SELECT_ADDED_FILENAMES_SQL = (
+    "SELECT id, filename FROM added_problems WHERE id IN (SELECT value FROM json_each(?))"
+)
+
+
+@lru_cache
+def upsert_problems_sql(rows: int) -> str:
+    """UPSERT_PROBLEM_SQL with one VALUES group per row, built once per row count."""
+    head, group = UPSERT_PROBLEM_SQL.rsplit("VALUES", 1)
+    return f"{head}VALUES {', '.join([group.strip()] * rows)}"
+
+
+def format_tags_display(tags: list[str]) -> str:
+    """Render tags for table display, truncating long lists with "..."."""
+    display = ", ".join(tags[:TAGS_DISPLAY_LIMIT])
+    if len(tags) > TAGS_DISPLAY_LIMIT:
+        display += "..."
+    return display
+
 
 class Database:
     """Manage SQLite database for LeetCode problems."""
@@ -18,13 +104,22 @@ class Database:
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True)
-        self._conn = None
+        # Each thread gets its own connection and transaction depth, so a
+        # reader never waits on another thread's write batch (WAL allows it)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Lowercased tag name -> stored spelling, loaded on first tag search
+        self._tag_names: dict[str, str] | None = None
         self._init_db()
 
     def _init_db(self):
         """Initialize database schema."""
-        conn = self._get_conn()
-        cursor = conn.cursor()
+        with self.transaction():
+            self._create_schema(self._get_conn().cursor())
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables, indexes and triggers, migrating older layouts."""
 
         # Problems table - stores all LeetCode problems
         cursor.execute("""
@@ -38,39 +133,192 @@ class Database:
                 tags TEXT NOT NULL,
                 hints TEXT,
                 url TEXT NOT NULL,
-                synced_at TEXT NOT NULL
+                synced_at TEXT NOT NULL,
+                tags_display TEXT
             )
         """)
 
-        # Added problems table - tracks user-generated files
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS added_problems (
+        # Databases created before tags_display existed get it backfilled
+        columns = {row["name"] for row in cursor.execute("PRAGMA table_info(problems)")}
+        if "tags_display" not in columns:
+            cursor.execute("ALTER TABLE problems ADD COLUMN tags_display TEXT")
+            rows = cursor.execute("SELECT id, tags FROM problems").fetchall()
+            cursor.executemany(
+                "UPDATE problems SET tags_display = ? WHERE id = ?",
+                [(format_tags_display(orjson.loads(row["tags"])), row["id"]) for row in rows],
+            )
+
+        # Added problems table - tracks user-generated files. WITHOUT ROWID
+        # clusters rows on id, so a lookup by id is a single b-tree descent
+        added_sql = """
+            CREATE TABLE {name} (
                 id INTEGER PRIMARY KEY,
                 filename TEXT NOT NULL,
                 added_at TEXT NOT NULL,
                 FOREIGN KEY (id) REFERENCES problems(id)
+            ) WITHOUT ROWID
+        """
+        row = cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'added_problems'"
+        ).fetchone()
+        if row is None:
+            cursor.execute(added_sql.format(name="added_problems"))
+        elif "WITHOUT ROWID" not in row["sql"].upper():
+            # Databases created with the rowid layout get their rows copied over
+            cursor.execute(added_sql.format(name="added_problems_new"))
+            cursor.execute(
+                "INSERT INTO added_problems_new (id, filename, added_at) "
+                "SELECT id, filename, added_at FROM added_problems"
             )
-        """)
+            cursor.execute("DROP TABLE added_problems")
+            cursor.execute("ALTER TABLE added_problems_new RENAME TO added_problems")
 
         # Create indexes
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_slug ON problems(slug)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_difficulty ON problems(difficulty)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_title ON problems(title)")
 
-        conn.commit()
+        # Full-text index over titles and slugs, kept in sync by triggers.
+        # The trigram tokenizer matches substrings, so results are the same as
+        # LIKE '%keyword%' without scanning every row
+        row = cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'problems_fts'").fetchone()
+        if row is not None and "tags" in row["sql"]:
+            # Older databases also indexed tags, which problem_tags now serves
+            for trigger in ("problems_fts_insert", "problems_fts_delete", "problems_fts_update"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute("DROP TABLE problems_fts")
+            row = None
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS problems_fts USING fts5(
+                title, slug,
+                content='problems', content_rowid='id', tokenize='trigram'
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problems_fts_insert AFTER INSERT ON problems BEGIN
+                INSERT INTO problems_fts(rowid, title, slug)
+                VALUES (new.id, new.title, new.slug);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problems_fts_delete AFTER DELETE ON problems BEGIN
+                INSERT INTO problems_fts(problems_fts, rowid, title, slug)
+                VALUES ('delete', old.id, old.title, old.slug);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problems_fts_update AFTER UPDATE ON problems BEGIN
+                INSERT INTO problems_fts(problems_fts, rowid, title, slug)
+                VALUES ('delete', old.id, old.title, old.slug);
+                INSERT INTO problems_fts(rowid, title, slug)
+                VALUES (new.id, new.title, new.slug);
+            END
+        """)
+        # Index problems synced before the full-text table existed
+        if row is None:
+            cursor.execute("INSERT INTO problems_fts(problems_fts) VALUES ('rebuild')")
+
+        # One row per (problem, tag), so tag lookups are an index range scan
+        # rather than a substring match over the JSON tags column. Triggers
+        # keep it in step with problems.tags
+        tags_exist = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'problem_tags'"
+        ).fetchone()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS problem_tags (
+                problem_id INTEGER NOT NULL,
+                tag TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (problem_id, tag)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tag ON problem_tags(tag, problem_id)")
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problem_tags_insert AFTER INSERT ON problems BEGIN
+                INSERT OR IGNORE INTO problem_tags(problem_id, tag)
+                SELECT new.id, value FROM json_each(new.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problem_tags_delete AFTER DELETE ON problems BEGIN
+                DELETE FROM problem_tags WHERE problem_id = old.id;
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS problem_tags_update AFTER UPDATE OF tags ON problems
+            BEGIN
+                DELETE FROM problem_tags WHERE problem_id = old.id;
+                INSERT OR IGNORE INTO problem_tags(problem_id, tag)
+                SELECT new.id, value FROM json_each(new.tags);
+            END
+        """)
+        if not tags_exist:
+            cursor.execute("""
+                INSERT OR IGNORE INTO problem_tags(problem_id, tag)
+                SELECT p.id, t.value FROM problems p, json_each(p.tags) t
+            """)
 
     def _get_conn(self) -> sqlite3.Connection:
-        """Get or create database connection."""
-        if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+        """Get or create the calling thread's database connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Autocommit mode: single statements commit on their own and
+            # transaction() issues an explicit BEGIN IMMEDIATE
+            conn = sqlite3.connect(
+                self.db_path,
+                cached_statements=STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.row_factory = sqlite3.Row
+            # WAL turns each commit into a sequential log append, and NORMAL
+            # sync skips the per-commit fsync that WAL doesn't need for safety
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(f"PRAGMA wal_autocheckpoint = {WAL_AUTOCHECKPOINT_PAGES}")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute(f"PRAGMA cache_size = -{PAGE_CACHE_KIB}")
+            # INSERT OR REPLACE only fires delete triggers for the replaced row
+            # with recursive triggers on; problems_fts relies on them
+            conn.execute("PRAGMA recursive_triggers = ON")
+            self._local.conn = conn
+            self._local.tx_depth = 0
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into a single transaction.
+
+        The outermost block takes the write lock up front with BEGIN
+        IMMEDIATE, so concurrent writers queue instead of failing to upgrade
+        a read transaction. It commits once on success and rolls back on
+        error; nested blocks join it.
+        """
+        conn = self._get_conn()
+        local = self._local
+        if local.tx_depth == 0:
+            conn.execute("BEGIN IMMEDIATE")
+        local.tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            local.tx_depth -= 1
+            if local.tx_depth == 0:
+                conn.rollback()
+            raise
+        local.tx_depth -= 1
+        if local.tx_depth == 0:
+            conn.commit()
 
     def close(self):
-        """Close database connection."""
-        if self._conn:
-            self._conn.close()
-            self._conn = None
+        """Close the database connections of all threads."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
     def __enter__(self):
         """Context manager entry."""
@@ -80,6 +328,24 @@ class Database:
         """Context manager exit."""
         self.close()
 
+    @staticmethod
+    def _problem_params(problem_data: dict, synced_at: str) -> tuple:
+        """Build the UPSERT_PROBLEM_SQL parameters for one problem."""
+        return (
+            problem_data["id"],
+            problem_data["title"],
+            problem_data["slug"],
+            problem_data["difficulty"],
+            problem_data["content"],
+            problem_data["code_snippet"],
+            # Use the JSON the API client already produced, if present
+            problem_data.get("tags_json") or orjson.dumps(problem_data["tags"]).decode(),
+            problem_data.get("hints_json") or orjson.dumps(problem_data.get("hints", [])).decode(),
+            problem_data["url"],
+            synced_at,
+            format_tags_display(problem_data["tags"]),
+        )
+
     def upsert_problem(self, problem_data: dict):
         """
         Insert or update a problem.
@@ -91,26 +357,63 @@ class Database:
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            INSERT OR REPLACE INTO problems
-            (id, title, slug, difficulty, content, code_snippet, tags, hints, url, synced_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                problem_data["id"],
-                problem_data["title"],
-                problem_data["slug"],
-                problem_data["difficulty"],
-                problem_data["content"],
-                problem_data["code_snippet"],
-                json.dumps(problem_data["tags"]),
-                json.dumps(problem_data.get("hints", [])),
-                problem_data["url"],
-                datetime.now().isoformat(),
-            ),
+            UPSERT_PROBLEM_SQL, self._problem_params(problem_data, datetime.now().isoformat())
         )
+        self._tag_names = None
+
+    def upsert_problems_many(self, problems: list[dict]) -> int:
+        """
+        Insert or update several problems with few statements in one transaction.
 
-        conn.commit()
+        A problem that can't be stored (violating a constraint) is skipped
+        without losing the rest of the batch.
+
+        Args:
+            problems: Problem data from LeetCode API
+
+        Returns:
+            Number of problems written
+        """
+        written = 0
+        with self.transaction():
+            cursor = self._get_conn().cursor()
+            # One timestamp for the whole batch, which is written at once anyway
+            synced_at = datetime.now().isoformat()
+            # Several rows per statement; the SQL is built once per chunk length
+            for start in range(0, len(problems), UPSERT_CHUNK_ROWS):
+                rows = [
+                    self._problem_params(p, synced_at)
+                    for p in problems[start : start + UPSERT_CHUNK_ROWS]
+                ]
+                try:
+                    cursor.execute(
+                        upsert_problems_sql(len(rows)), [value for row in rows for value in row]
+                    )
+                    written += len(rows)
+                except sqlite3.IntegrityError:
+                    # Only the failed statement is undone; retry its rows one
+                    # at a time so just the offending ones are skipped
+                    for row in rows:
+                        try:
+                            cursor.execute(UPSERT_PROBLEM_SQL, row)
+                        except sqlite3.IntegrityError:
+                            continue
+                        written += 1
+        self._tag_names = None
+        return written
+
+    def get_problem_ids(self) -> set[int]:
+        """
+        Get the IDs of all problems in the database.
+
+        Returns:
+            Set of problem IDs
+        """
+        conn = self._get_conn()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT id FROM problems")
+        return {row["id"] for row in cursor.fetchall()}
 
     def get_problem(self, problem_id: int) -> dict | None:
         """
@@ -125,7 +428,7 @@ class Database:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM problems WHERE id = ?", (problem_id,))
+        cursor.execute(SELECT_PROBLEM_SQL, (problem_id,))
         row = cursor.fetchone()
 
         if not row:
@@ -146,7 +449,7 @@ class Database:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute("SELECT * FROM problems WHERE slug = ?", (slug,))
+        cursor.execute(SELECT_PROBLEM_BY_SLUG_SQL, (slug,))
         row = cursor.fetchone()
 
         if not row:
@@ -154,53 +457,71 @@ class Database:
 
         return self._row_to_dict(row)
 
-    def search_by_title(self, keyword: str) -> list[dict]:
+    def get_problems(self, problem_ids: list[int]) -> dict[int, dict]:
         """
-        Search problems by title keyword.
+        Get several problems by ID in one query.
 
         Args:
-            keyword: Search keyword
+            problem_ids: Problem IDs
 
         Returns:
-            List of matching problems
+            Dictionary mapping each found ID to its problem data
         """
+        if not problem_ids:
+            return {}
+
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT * FROM problems
-            WHERE title LIKE ? OR slug LIKE ?
-            ORDER BY id
-        """,
-            (f"%{keyword}%", f"%{keyword}%"),
-        )
+        cursor.execute(SELECT_PROBLEMS_BY_IDS_SQL, (orjson.dumps(problem_ids).decode(),))
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return {row["id"]: self._row_to_dict(row) for row in cursor.fetchall()}
 
-    def search_by_tag(self, tag: str) -> list[dict]:
+    def get_problems_by_slugs(self, slugs: list[str]) -> dict[str, dict]:
         """
-        Search problems by tag.
+        Get several problems by slug in one query.
 
         Args:
-            tag: Tag name
+            slugs: Problem slugs
 
         Returns:
-            List of matching problems
+            Dictionary mapping each found slug to its problem data
         """
+        if not slugs:
+            return {}
+
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT * FROM problems
-            WHERE tags LIKE ?
-            ORDER BY id
-        """,
-            (f"%{tag}%",),
-        )
+        cursor.execute(SELECT_PROBLEMS_BY_SLUGS_SQL, (orjson.dumps(slugs).decode(),))
 
-        return [self._row_to_dict(row) for row in cursor.fetchall()]
+        return {row["slug"]: self._row_to_dict(row) for row in cursor.fetchall()}
+
+    def search_by_title(self, keyword: str) -> list[dict]:
+        """
+        Search problems by title keyword.
+
+        Args:
+            keyword: Search keyword
+
+        Returns:
+            List of matching problems with id, title, slug, difficulty,
+            tags_display and url
+        """
+        return list(self.iter_search(keyword))
+
+    def search_by_tag(self, tag: str) -> list[dict]:
+        """
+        Search problems by tag.
+
+        Args:
+            tag: Tag name
+
+        Returns:
+            List of matching problems with id, title, slug, difficulty,
+            tags_display and url
+        """
+        return list(self.iter_search(tag, by_tag=True))
 
     def mark_as_added(self, problem_id: int, filename: str):
         """
@@ -221,7 +542,27 @@ class Database:
             (problem_id, filename, datetime.now().isoformat()),
         )
 
-        conn.commit()
+    def mark_as_added_many(self, entries: list[tuple[int, str]]) -> int:
+        """
+        Mark several problems as added in one transaction.
+
+        Args:
+            entries: (problem ID, generated filename) pairs
+
+        Returns:
+            Number of problems marked
+        """
+        with self.transaction():
+            cursor = self._get_conn().cursor()
+            added_at = datetime.now().isoformat()
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO added_problems (id, filename, added_at)
+                VALUES (?, ?, ?)
+            """,
+                [(problem_id, filename, added_at) for problem_id, filename in entries],
+            )
+        return len(entries)
 
     def is_added(self, problem_id: int) -> bool:
         """
@@ -256,6 +597,25 @@ class Database:
         row = cursor.fetchone()
         return row["filename"] if row else None
 
+    def get_added_filenames(self, problem_ids: list[int]) -> dict[int, str]:
+        """
+        Get the filenames of several added problems in one query.
+
+        Args:
+            problem_ids: Problem IDs
+
+        Returns:
+            Dictionary mapping each added ID to its filename
+        """
+        if not problem_ids:
+            return {}
+
+        conn = self._get_conn()
+        cursor = conn.cursor()
+
+        cursor.execute(SELECT_ADDED_FILENAMES_SQL, (orjson.dumps(problem_ids).decode(),))
+        return {row["id"]: row["filename"] for row in cursor.fetchall()}
+
     def get_all_added_problems(self) -> list[dict]:
         """
         Get all added problems.
@@ -268,52 +628,49 @@ class Database:
 
         cursor.execute(
             """
-            SELECT p.*, a.filename, a.added_at
-            FROM problems p
-            JOIN added_problems a ON p.id = a.id
-            ORDER BY p.id
+            SELECT p.id, p.title, p.slug, p.difficulty, p.content, p.code_snippet, p.tags,
+                   p.hints, p.url, p.synced_at, p.tags_display, a.filename, a.added_at
+            FROM added_problems a
+            JOIN problems p ON p.id = a.id
+            ORDER BY a.id
         """
         )
 
-        results = []
-        for row in cursor.fetchall():
-            problem = self._row_to_dict(row)
-            problem["filename"] = row["filename"]
-            results.append(problem)
+        return [self._row_to_dict(row) for row in cursor]
 
-        return results
-
-    def search_added_by_title(self, keyword: str) -> list[dict]:
+    def iter_added_min(self, limit: int = -1, offset: int = 0) -> Iterator[dict]:
         """
-        Search added problems by title keyword.
+        Iterate over added problems with only the fields needed to list them.
+
+        Unlike get_all_added_problems(), rows are streamed and the large
+        content, code and hints columns are never read or decoded.
 
         Args:
-            keyword: Search keyword
+            limit: Maximum number of problems, or -1 for all
+            offset: Number of leading problems to skip
 
-        Returns:
-            List of matching added problems
+        Yields:
+            Dictionaries with id, title, slug, difficulty, tags_display and
+            filename, ordered by ID
         """
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT p.*, a.filename, a.added_at
-            FROM problems p
-            JOIN added_problems a ON p.id = a.id
-            WHERE p.title LIKE ? OR p.slug LIKE ?
-            ORDER BY p.id
-        """,
-            (f"%{keyword}%", f"%{keyword}%"),
-        )
+        cursor.execute(SELECT_ADDED_SUMMARIES_SQL, (limit, offset))
+        for row in cursor:
+            yield dict(row)
 
-        results = []
-        for row in cursor.fetchall():
-            problem = self._row_to_dict(row)
-            problem["filename"] = row["filename"]
-            results.append(problem)
+    def search_added_by_title(self, keyword: str) -> list[dict]:
+        """
+        Search added problems by title keyword.
+
+        Args:
+            keyword: Search keyword
 
-        return results
+        Returns:
+            List of matching added problems, with the fields of iter_added_min()
+        """
+        return list(self.iter_search(keyword, added_only=True))
 
     def search_added_by_tag(self, tag: str) -> list[dict]:
         """
@@ -323,29 +680,180 @@ class Database:
             tag: Tag name
 
         Returns:
-            List of matching added problems
+            List of matching added problems, with the fields of iter_added_min()
+        """
+        return list(self.iter_search(tag, by_tag=True, added_only=True))
+
+    def iter_search(
+        self,
+        keyword: str,
+        by_tag: bool = False,
+        added_only: bool = False,
+        limit: int = -1,
+        offset: int = 0,
+    ) -> Iterator[dict]:
         """
+        Stream search results, optionally one page at a time.
+
+        Rows are yielded straight from the cursor, so a caller that stops
+        early never fetches the remaining matches.
+
+        Args:
+            keyword: Title keyword, or tag name if by_tag is set
+            by_tag: Search tags instead of title and slug
+            added_only: Only return added problems, as iter_added_min() summaries
+            limit: Maximum number of results, or -1 for all
+            offset: Number of leading results to skip
+
+        Yields:
+            Matching problem summaries ordered by ID
+        """
+        if by_tag:
+            return self._iter_search_tag(keyword, added_only, limit, offset)
+        return self._iter_search(keyword, ("title", "slug"), added_only, limit, offset)
+
+    @staticmethod
+    def _search_clauses(added_only: bool) -> tuple[str, str, str]:
+        """
+        Return the SELECT, optional added_problems JOIN and ORDER BY key for a search.
+
+        Added-only searches order by a.id, which lets SQLite walk added_problems
+        in key order and probe problems by rowid instead of scanning every
+        problem and sorting the few that were added.
+        """
+        if added_only:
+            return (
+                f"SELECT {ADDED_SUMMARY_COLUMNS}",
+                "JOIN added_problems a ON p.id = a.id",
+                "a.id",
+            )
+        return f"SELECT {PROBLEM_SUMMARY_COLUMNS}", "", "p.id"
+
+    def _get_tag_names(self) -> dict[str, str]:
+        """Map every known tag name, lowercased once, to its stored spelling."""
+        if self._tag_names is None:
+            cursor = self._get_conn().execute("SELECT DISTINCT tag FROM problem_tags")
+            self._tag_names = {row["tag"].lower(): row["tag"] for row in cursor}
+        return self._tag_names
+
+    def _iter_search_tag(
+        self, tag: str, added_only: bool, limit: int, offset: int
+    ) -> Iterator[dict]:
+        """
+        Find problems with a tag, case-insensitively.
+
+        A keyword that names a known tag matches that tag exactly, so "Array"
+        doesn't also match other tags containing it. Anything else matches
+        every tag name containing the keyword. The keyword is resolved to tag
+        names in one pass over the known names, and problems are then found
+        through the problem_tags index. An empty keyword matches every
+        problem, including those without tags.
+
+        Args:
+            tag: Tag name or part of one
+            added_only: Only return added problems, as iter_added_min() summaries
+            limit: Maximum number of results, or -1 for all
+            offset: Number of leading results to skip
+
+        Yields:
+            Matching problem summaries ordered by ID
+        """
+        if not tag:
+            # Like an empty title keyword, match every problem, tagged or not
+            yield from self._iter_search("", ("title", "slug"), added_only, limit, offset)
+            return
+
+        tag_names = self._get_tag_names()
+        needle = tag.lower()
+        if needle in tag_names:
+            matched = [tag_names[needle]]
+        else:
+            matched = [name for lowered, name in tag_names.items() if needle in lowered]
+        if not matched:
+            return
+
         conn = self._get_conn()
         cursor = conn.cursor()
 
+        select, join, order = self._search_clauses(added_only)
         cursor.execute(
-            """
-            SELECT p.*, a.filename, a.added_at
+            f"""
+            {select}
             FROM problems p
-            JOIN added_problems a ON p.id = a.id
-            WHERE p.tags LIKE ?
-            ORDER BY p.id
+            {join}
+            WHERE p.id IN (
+                SELECT problem_id FROM problem_tags
+                WHERE tag IN (SELECT value FROM json_each(?))
+            )
+            ORDER BY {order}
+            LIMIT ? OFFSET ?
         """,
-            (f"%{tag}%",),
+            (orjson.dumps(matched).decode(), limit, offset),
         )
+        for row in cursor:
+            yield dict(row)
+
+    def _iter_search(
+        self, keyword: str, columns: tuple[str, ...], added_only: bool, limit: int, offset: int
+    ) -> Iterator[dict]:
+        """
+        Find problems whose given columns contain a keyword, case-insensitively.
+
+        Keywords of at least FTS_MIN_CHARS characters are looked up in
+        problems_fts; shorter ones fall back to a LIKE scan. An empty keyword
+        matches every problem without evaluating any LIKE.
+
+        Args:
+            keyword: Substring to look for
+            columns: Columns of problems to search
+            added_only: Only return added problems, as iter_added_min() summaries
+            limit: Maximum number of results, or -1 for all
+            offset: Number of leading results to skip
+
+        Yields:
+            Matching problem summaries ordered by ID
+        """
+        conn = self._get_conn()
+        cursor = conn.cursor()
 
-        results = []
-        for row in cursor.fetchall():
-            problem = self._row_to_dict(row)
-            problem["filename"] = row["filename"]
-            results.append(problem)
+        select, join, order = self._search_clauses(added_only)
+
+        if len(keyword) >= FTS_MIN_CHARS:
+            phrase = keyword.replace('"', '""')
+            # Materializing the matches forces the FTS lookup to run first;
+            # otherwise a filter on the joined tables can make the planner
+            # probe problems_fts once per row of that filter instead
+            cursor.execute(
+                f"""
+                WITH matches AS MATERIALIZED (
+                    SELECT rowid FROM problems_fts WHERE problems_fts MATCH ?
+                )
+                {select}
+                FROM matches m
+                JOIN problems p ON p.id = m.rowid
+                {join}
+                ORDER BY {order}
+                LIMIT ? OFFSET ?
+            """,
+                (f'{{{" ".join(columns)}}} : "{phrase}"', limit, offset),
+            )
+        else:
+            # The empty-keyword test comes first so OR short-circuits the LIKEs
+            where = " OR ".join(["? = ''"] + [f"p.{column} LIKE ?" for column in columns])
+            cursor.execute(
+                f"""
+                {select}
+                FROM problems p
+                {join}
+                WHERE {where}
+                ORDER BY {order}
+                LIMIT ? OFFSET ?
+            """,
+                (keyword, *(f"%{keyword}%",) * len(columns), limit, offset),
+            )
 
-        return results
+        for row in cursor:
+            yield dict(row)
 
     def get_statistics(self) -> dict:
         """
@@ -357,42 +865,46 @@ class Database:
         conn = self._get_conn()
         cursor = conn.cursor()
 
-        # Total count
-        cursor.execute("SELECT COUNT(*) as count FROM added_problems")
-        total = cursor.fetchone()["count"]
-
-        # By difficulty
+        # Total and per-difficulty counts in one pass over added_problems. The
+        # LEFT JOIN keeps added IDs missing from problems in the total, as a
+        # NULL difficulty group that isn't reported as a difficulty
         cursor.execute(
             """
             SELECT p.difficulty, COUNT(*) as count
-            FROM problems p
-            JOIN added_problems a ON p.id = a.id
+            FROM added_problems a
+            LEFT JOIN problems p ON p.id = a.id
             GROUP BY p.difficulty
         """
         )
-        by_difficulty = {row["difficulty"]: row["count"] for row in cursor.fetchall()}
-
-        # By tag (top 10)
+        total = 0
+        by_difficulty = {}
+        for row in cursor:
+            total += row["count"]
+            if row["difficulty"] is not None:
+                by_difficulty[row["difficulty"]] = row["count"]
+
+        # By tag (top 10), ties listed in the order the tags first appear when
+        # walking added problems by ID and each problem's tags as stored.
+        # problem_tags doesn't keep that order, so tags are read from the JSON
         cursor.execute(
             """
-            SELECT p.tags
-            FROM problems p
-            JOIN added_problems a ON p.id = a.id
+            SELECT tag, COUNT(*) as count
+            FROM (
+                SELECT j.value as tag, ROW_NUMBER() OVER (ORDER BY a.id, j.key) as seen
+                FROM added_problems a
+                JOIN problems p ON p.id = a.id, json_each(p.tags) j
+            )
+            GROUP BY tag
+            ORDER BY count DESC, MIN(seen)
+            LIMIT 10
         """
         )
-        all_tags = []
-        for row in cursor.fetchall():
-            tags = json.loads(row["tags"])
-            all_tags.extend(tags)
-
-        from collections import Counter
-
-        tag_counts = Counter(all_tags)
+        by_tag = {row["tag"]: row["count"] for row in cursor.fetchall()}
 
         return {
             "total": total,
             "by_difficulty": by_difficulty,
-            "by_tag": dict(tag_counts.most_common(10)),
+            "by_tag": by_tag,
         }
 
     def get_sync_status(self) -> dict:
@@ -418,7 +930,7 @@ class Database:
         data = dict(row)
         # Parse JSON fields
         if "tags" in data:
-            data["tags"] = json.loads(data["tags"])
+            data["tags"] = orjson.loads(data["tags"])
         if "hints" in data and data["hints"]:
-            data["hints"] = json.loads(data["hints"])
+            data["hints"] = orjson.loads(data["hints"])
         return data
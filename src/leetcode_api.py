@@ -1,9 +1,17 @@
 """LeetCode GraphQL API client for fetching problem information."""
 
+import os
 import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
+from pathlib import Path
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from urllib3.util.retry import Retry
 
 
 class LeetCodeAPI:
@@ -12,8 +20,43 @@ class LeetCodeAPI:
     GRAPHQL_URL = "https://leetcode.com/graphql"
     PROBLEM_URL = "https://leetcode.com/problems/{slug}/"
 
-    def __init__(self):
-        """Initialize the API client."""
+    # Problems fetched per GraphQL request during sync
+    SYNC_PAGE_SIZE = 20
+
+    # Problems buffered during sync before they are written in one transaction
+    SYNC_BATCH_SIZE = 200
+
+    # Concurrent GraphQL requests during sync
+    SYNC_WORKERS = 8
+
+    # Seconds a persisted ID -> slug mapping is reused before refetching
+    SLUG_CACHE_TTL = 24 * 60 * 60
+
+    # Fields requested for every question, shared by single and batch queries
+    QUESTION_FIELDS = """
+                questionFrontendId
+                title
+                titleSlug
+                content
+                difficulty
+                topicTags {
+                    name
+                    slug
+                }
+                codeSnippets {
+                    langSlug
+                    code
+                }
+                hints
+            """
+
+    def __init__(self, slug_cache_path: str = "data/id_to_slug.json"):
+        """
+        Initialize the API client.
+
+        Args:
+            slug_cache_path: File where the ID -> slug mapping is persisted
+        """
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -21,9 +64,24 @@ class LeetCodeAPI:
                 "Referer": "https://leetcode.com",
             }
         )
+        # Keep-alive pool large enough for the sync workers, backing off and
+        # retrying when LeetCode rate-limits or fails. Queries only read, so
+        # retrying POST is safe
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=None,
+        )
+        self.session.mount(
+            "https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+        )
         # Cache for ID -> slug mapping to avoid repeated API calls
         self._id_to_slug_cache: dict[int, str] = {}
         self._cache_loaded = False
+        # Whether the mapping came from slug_cache_path rather than the API
+        self._cache_from_disk = False
+        self.slug_cache_path = Path(slug_cache_path)
 
     def get_problem_by_slug(self, slug: str) -> dict | None:
         """
@@ -35,28 +93,10 @@ class LeetCodeAPI:
         Returns:
             Dictionary containing problem information or None if not found
         """
-        query = """
-        query questionData($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                questionId
-                questionFrontendId
-                title
-                titleSlug
-                content
-                difficulty
-                exampleTestcases
-                topicTags {
-                    name
-                    slug
-                }
-                codeSnippets {
-                    lang
-                    langSlug
-                    code
-                }
-                hints
-            }
-        }
+        query = f"""
+        query questionData($titleSlug: String!) {{
+            question(titleSlug: $titleSlug) {{{self.QUESTION_FIELDS}}}
+        }}
         """
 
         variables = {"titleSlug": slug}
@@ -65,7 +105,7 @@ class LeetCodeAPI:
         try:
             response = self.session.post(self.GRAPHQL_URL, json=payload, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if "errors" in data:
                 return None
@@ -76,14 +116,105 @@ class LeetCodeAPI:
 
             return self._format_problem_data(question)
 
-        except requests.exceptions.RequestException:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
             return None
 
-    def _load_id_to_slug_cache(self):
-        """Load ID to slug mapping cache (called once)."""
-        if self._cache_loaded:
+    def get_problems_by_slugs(self, slugs: list[str]) -> dict[str, dict]:
+        """
+        Get details for several problems in a single GraphQL request.
+
+        Each slug becomes an aliased ``question`` field of one query, so N
+        problems cost one round-trip instead of N.
+
+        Args:
+            slugs: Problem slugs
+
+        Returns:
+            Dictionary mapping each found slug to its problem information
+        """
+        slugs = list(dict.fromkeys(slugs))
+        if not slugs:
+            return {}
+
+        params = ", ".join(f"$s{i}: String!" for i in range(len(slugs)))
+        fields = "".join(
+            f"q{i}: question(titleSlug: $s{i}) {{{self.QUESTION_FIELDS}}}\n"
+            for i in range(len(slugs))
+        )
+        query = f"query questionsData({params}) {{\n{fields}}}"
+        variables = {f"s{i}": slug for i, slug in enumerate(slugs)}
+        payload = {"query": query, "variables": variables}
+
+        try:
+            response = self.session.post(self.GRAPHQL_URL, json=payload, timeout=30)
+            response.raise_for_status()
+            data = orjson.loads(response.content).get("data") or {}
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
+            return {}
+
+        results = {}
+        for i, slug in enumerate(slugs):
+            question = data.get(f"q{i}")
+            if question:
+                try:
+                    results[slug] = self._format_problem_data(question)
+                except (KeyError, TypeError, ValueError, AttributeError):
+                    # Skip a malformed question without losing the others
+                    continue
+        return results
+
+    def _read_slug_cache_file(self) -> bool:
+        """
+        Load the ID to slug mapping from disk if it is fresh enough.
+
+        Returns:
+            True if the cache was loaded, False if missing, stale or unreadable
+        """
+        try:
+            age = time.time() - self.slug_cache_path.stat().st_mtime
+            if age > self.SLUG_CACHE_TTL:
+                return False
+            data = orjson.loads(self.slug_cache_path.read_bytes())
+        except (OSError, ValueError):
+            return False
+
+        self._id_to_slug_cache = {int(problem_id): slug for problem_id, slug in data.items()}
+        return True
+
+    def _write_slug_cache_file(self):
+        """Persist the ID to slug mapping so later runs can skip the download."""
+        # Written to a temporary file and renamed over the old one, so readers
+        # never see a partly written mapping
+        tmp_path = self.slug_cache_path.with_name(self.slug_cache_path.name + ".tmp")
+        try:
+            self.slug_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                orjson.dumps(self._id_to_slug_cache, option=orjson.OPT_NON_STR_KEYS)
+            )
+            os.replace(tmp_path, self.slug_cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _load_id_to_slug_cache(self, refresh: bool = False):
+        """
+        Load ID to slug mapping cache (called once).
+
+        The mapping is read from slug_cache_path while it is younger than
+        SLUG_CACHE_TTL, and downloaded (then persisted) otherwise.
+
+        Args:
+            refresh: Ignore the persisted mapping and download it again
+        """
+        if self._cache_loaded and not refresh:
             return
 
+        if not refresh and self._read_slug_cache_file():
+            self._cache_loaded = True
+            self._cache_from_disk = True
+            return
+
+        self._cache_from_disk = False
+
         query = """
         query problemsetQuestionList($categorySlug: String, $limit: Int, $skip: Int, $filters: QuestionListFilterInput) {
             problemsetQuestionList: questionList(
@@ -111,7 +242,7 @@ class LeetCodeAPI:
         try:
             response = self.session.post(self.GRAPHQL_URL, json=payload, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             questions = data.get("data", {}).get("problemsetQuestionList", {}).get("questions", [])
 
@@ -123,10 +254,25 @@ class LeetCodeAPI:
                     self._id_to_slug_cache[int(frontend_id)] = slug
 
             self._cache_loaded = True
+            self._write_slug_cache_file()
 
-        except requests.exceptions.RequestException:
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError):
             pass
 
+    def _load_id_to_slug_cache_for(self, problem_ids: list[int]):
+        """
+        Load the ID to slug mapping, making sure it is current for problem_ids.
+
+        A persisted mapping can predate problems published since it was
+        written, so if it lacks any of the IDs it is downloaded again, once.
+
+        Args:
+            problem_ids: Problem frontend IDs about to be looked up
+        """
+        self._load_id_to_slug_cache()
+        if self._cache_from_disk and any(pid not in self._id_to_slug_cache for pid in problem_ids):
+            self._load_id_to_slug_cache(refresh=True)
+
     def get_problem_by_id(self, problem_id: int) -> dict | None:
         """
         Get problem details by problem frontend ID.
@@ -138,7 +284,7 @@ class LeetCodeAPI:
             Dictionary containing problem information or None if not found
         """
         # Load cache on first call (lazy loading)
-        self._load_id_to_slug_cache()
+        self._load_id_to_slug_cache_for([problem_id])
 
         # Lookup slug from cache
         slug = self._id_to_slug_cache.get(problem_id)
@@ -147,6 +293,47 @@ class LeetCodeAPI:
 
         return self.get_problem_by_slug(slug)
 
+    def get_slugs_by_ids(self, problem_ids: list[int]) -> dict[int, str]:
+        """
+        Look up the slugs of several problems by frontend ID.
+
+        Args:
+            problem_ids: Problem frontend IDs
+
+        Returns:
+            Dictionary mapping each known ID to its slug
+        """
+        if not problem_ids:
+            return {}
+
+        self._load_id_to_slug_cache_for(problem_ids)
+
+        slugs = {}
+        for problem_id in problem_ids:
+            slug = self._id_to_slug_cache.get(problem_id)
+            if slug:
+                slugs[problem_id] = slug
+        return slugs
+
+    def get_problems_by_ids(self, problem_ids: list[int]) -> dict[int, dict]:
+        """
+        Get details for several problems by frontend ID in a single request.
+
+        Args:
+            problem_ids: Problem frontend IDs
+
+        Returns:
+            Dictionary mapping each found ID to its problem information
+        """
+        if not problem_ids:
+            return {}
+
+        slugs = self.get_slugs_by_ids(problem_ids)
+        problems = self.get_problems_by_slugs(list(slugs.values()))
+        return {
+            problem_id: problems[slug] for problem_id, slug in slugs.items() if slug in problems
+        }
+
     def close(self):
         """Close the HTTP session and release resources."""
         if self.session:
@@ -162,43 +349,110 @@ class LeetCodeAPI:
 
     def _format_problem_data(self, question: dict) -> dict:
         """Format raw GraphQL response into structured problem data."""
+        # Fields may be present but null (premium problems have no content),
+        # so fall back with `or` rather than a get() default
+
         # Get Python code snippet
-        python_snippet = ""
         code_snippets = question.get("codeSnippets") or []
-        for snippet in code_snippets:
-            if snippet.get("langSlug") == "python3":
-                python_snippet = snippet.get("code", "")
-                break
+        python_snippet = next(
+            (s.get("code") or "" for s in code_snippets if s.get("langSlug") == "python3"), ""
+        )
+
+        tags = [tag["name"] for tag in (question.get("topicTags") or [])]
+        hints = question.get("hints") or []
+        slug = question.get("titleSlug") or ""
 
         return {
-            "id": int(question.get("questionFrontendId", 0)),
-            "title": question.get("title", ""),
-            "slug": question.get("titleSlug", ""),
-            "difficulty": question.get("difficulty", ""),
-            "content": question.get("content", ""),
-            "tags": [tag["name"] for tag in (question.get("topicTags") or [])],
-            "hints": question.get("hints") or [],
+            "id": int(question.get("questionFrontendId") or 0),
+            "title": question.get("title") or "",
+            "slug": slug,
+            "difficulty": question.get("difficulty") or "",
+            "content": question.get("content") or "",
+            "tags": tags,
+            "hints": hints,
+            # Serialized once here so Database.upsert_problem can store them as-is
+            "tags_json": orjson.dumps(tags).decode(),
+            "hints_json": orjson.dumps(hints).decode(),
             "code_snippet": python_snippet,
-            "url": self.PROBLEM_URL.format(slug=question.get("titleSlug", "")),
+            "url": self.PROBLEM_URL.format(slug=slug),
         }
 
+    def iter_problems(
+        self, slugs: list[str], page_size: int = SYNC_PAGE_SIZE
+    ) -> Iterator[tuple[list[str], list[dict]]]:
+        """
+        Fetch problems one page at a time, SYNC_WORKERS pages concurrently.
+
+        Pages are yielded as soon as their request completes, so callers can
+        persist each page while the remaining ones are still in flight.
+
+        Args:
+            slugs: Problem slugs to fetch
+            page_size: Number of problems per request
+
+        Yields:
+            Tuple of (slugs requested, problems found) for each page, in
+            completion order. A page whose request fails yields no problems
+        """
+        pages = iter(
+            [slugs[start : start + page_size] for start in range(0, len(slugs), page_size)]
+        )
+        executor = ThreadPoolExecutor(max_workers=self.SYNC_WORKERS)
+        in_flight = {}
+
+        def submit_next():
+            page = next(pages, None)
+            if page is not None:
+                in_flight[executor.submit(self.get_problems_by_slugs, page)] = page
+
+        try:
+            # Only a bounded window of requests is queued, so a consumer that
+            # stops early leaves little work behind
+            for _ in range(2 * self.SYNC_WORKERS):
+                submit_next()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        problems = list(future.result().values())
+                    except Exception:
+                        # Skip the page rather than abort the whole sync
+                        problems = []
+                    yield page, problems
+        finally:
+            # Don't send the requests still queued if the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def sync_all_problems(self, db, skip_existing: bool = True):
         """
         Sync all LeetCode problems to database.
 
+        Fetched problems are buffered and written SYNC_BATCH_SIZE at a time,
+        each batch in a single transaction, rather than collected in memory
+        first.
+
         Args:
             db: Database instance
             skip_existing: If True, skip problems already in database
 
         Returns:
-            Number of problems synced
+            Tuple of (problems synced, problems skipped)
         """
-        # First, load the ID-to-slug cache if not already loaded
-        self._load_id_to_slug_cache()
+        # Always fetch the current problem list so newly published problems
+        # are not hidden behind a persisted mapping
+        self._load_id_to_slug_cache(refresh=True)
 
         total = len(self._id_to_slug_cache)
+        existing_ids = db.get_problem_ids() if skip_existing else set()
+        pending = [
+            slug
+            for problem_id, slug in self._id_to_slug_cache.items()
+            if problem_id not in existing_ids
+        ]
+        skipped_count = total - len(pending)
         synced_count = 0
-        skipped_count = 0
 
         print(f"\n🔄 Syncing {total} problems from LeetCode...")
         print("⏳ This may take 2-5 minutes. Please be patient.\n")
@@ -210,30 +464,19 @@ class LeetCodeAPI:
             TaskProgressColumn(),
         ) as progress:
             task = progress.add_task("Syncing problems...", total=total)
-
-            for problem_id, slug in self._id_to_slug_cache.items():
-                # Check if already exists
-                if skip_existing:
-                    existing = db.get_problem(problem_id)
-                    if existing:
-                        skipped_count += 1
-                        progress.advance(task)
-                        continue
-
-                # Fetch full problem details
-                try:
-                    problem_data = self.get_problem_by_slug(slug)
-                    if problem_data:
-                        db.upsert_problem(problem_data)
-                        synced_count += 1
-
-                    # Rate limiting: be nice to LeetCode servers
-                    time.sleep(0.1)
-
-                except Exception:
-                    # Continue on error, don't interrupt sync
-                    pass
-
-                progress.advance(task)
+            progress.advance(task, skipped_count)
+
+            buffer: list[dict] = []
+            # Closed explicitly so a failed write stops the remaining requests
+            with closing(self.iter_problems(pending)) as pages:
+                for page, problems in pages:
+                    buffer.extend(problems)
+                    if len(buffer) >= self.SYNC_BATCH_SIZE:
+                        synced_count += db.upsert_problems_many(buffer)
+                        buffer.clear()
+                    progress.advance(task, len(page))
+
+            if buffer:
+                synced_count += db.upsert_problems_many(buffer)
 
         return synced_count, skipped_count
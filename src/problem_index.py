@@ -1,6 +1,6 @@
 """Manage local index of LeetCode problems using SQLite."""
 
-import json
+import os
 from pathlib import Path
 
 from src.database import Database
@@ -19,6 +19,9 @@ class ProblemIndex:
         """
         self.db = Database(db_path)
         self.solutions_dir = Path(solutions_dir)
+        # Listing of solutions_dir, reused while the directory's mtime is unchanged
+        self._solution_files: set[str] | None = None
+        self._solution_files_mtime = 0
 
     def add_problem(self, problem_data: dict, filename: str):
         """
@@ -30,6 +33,19 @@ class ProblemIndex:
         """
         # Mark as added in database
         self.db.mark_as_added(problem_data["id"], filename)
+        self._note_solution_files([filename])
+
+    def add_problems(self, entries: list[tuple[int, str]]):
+        """
+        Add several problems to the index with a single write.
+
+        Args:
+            entries: (problem ID, generated filename) pairs
+        """
+        if not entries:
+            return
+        self.db.mark_as_added_many(entries)
+        self._note_solution_files([filename for _, filename in entries])
 
     def get_problem(self, problem_id: int) -> dict | None:
         """
@@ -43,6 +59,30 @@ class ProblemIndex:
         """
         return self.db.get_problem(problem_id)
 
+    def get_problems(self, problem_ids: list[int]) -> dict[int, dict]:
+        """
+        Get information for several problems by ID.
+
+        Args:
+            problem_ids: Problem numbers
+
+        Returns:
+            Dictionary mapping each found ID to its problem data
+        """
+        return self.db.get_problems(problem_ids)
+
+    def get_problems_by_slugs(self, slugs: list[str]) -> dict[str, dict]:
+        """
+        Get information for several problems by slug.
+
+        Args:
+            slugs: Problem slugs
+
+        Returns:
+            Dictionary mapping each found slug to its problem data
+        """
+        return self.db.get_problems_by_slugs(slugs)
+
     def problem_exists(self, problem_id: int) -> bool:
         """
         Check if a problem is already added.
@@ -53,16 +93,60 @@ class ProblemIndex:
         Returns:
             True if problem is added and file exists, False otherwise
         """
-        if not self.db.is_added(problem_id):
-            return False
-
-        # Get filename from database
+        # One query answers both "is it added" and "under which filename"
         filename = self.db.get_added_filename(problem_id)
         if not filename:
             return False
 
-        filepath = self.solutions_dir / filename
-        return filepath.exists()
+        return filename in self._list_solution_files()
+
+    def get_existing_ids(self, problem_ids: list[int]) -> set[int]:
+        """
+        Check which of several problems are already added, in one query.
+
+        File existence is checked against a single listing of the solutions
+        directory rather than one stat() per problem.
+
+        Args:
+            problem_ids: Problem numbers
+
+        Returns:
+            IDs of problems that are added and whose file exists
+        """
+        filenames = self.db.get_added_filenames(problem_ids)
+        if not filenames:
+            return set()
+
+        present = self._list_solution_files()
+        return {pid for pid, name in filenames.items() if name in present}
+
+    def _list_solution_files(self) -> set[str]:
+        """
+        Names of the entries in the solutions directory.
+
+        The listing is cached and only rescanned when the directory's mtime
+        changes, so repeated checks cost one stat() instead of one per file.
+        """
+        try:
+            mtime = self.solutions_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return set()
+
+        if self._solution_files is None or mtime != self._solution_files_mtime:
+            with os.scandir(self.solutions_dir) as entries:
+                self._solution_files = {entry.name for entry in entries}
+            self._solution_files_mtime = mtime
+        return self._solution_files
+
+    def _note_solution_files(self, filenames: list[str]):
+        """
+        Add just-written files to the cached listing instead of dropping it.
+
+        The directory's mtime may not have moved if the files were written
+        within the same timestamp tick, so the listing is updated directly.
+        """
+        if self._solution_files is not None:
+            self._solution_files.update(filenames)
 
     def search_by_title(self, keyword: str) -> list[dict]:
         """
@@ -93,9 +177,9 @@ class ProblemIndex:
         Get all added problems.
 
         Returns:
-            List of all problems, sorted by ID
+            List of problem summaries (see Database.iter_added_min), sorted by ID
         """
-        return self.db.get_all_added_problems()
+        return list(self.db.iter_added_min())
 
     def get_statistics(self) -> dict:
         """
@@ -1,14 +1,56 @@
 """Generate solution files for LeetCode problems."""
 
+import ast
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import html2text
 
+# Method header on its own line; snippets leave the bodies empty, so a
+# `pass` is inserted after each before parsing
+DEF_LINE_RE = re.compile(r"^([ \t]*)(def\b.*:)[ \t]*$", re.MULTILINE)
+
+# First method definition in a code snippet, capturing its name; used when
+# the snippet can't be parsed
+FUNCTION_DEF_RE = re.compile(r"def\s+(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:")
+
+# Runs of blank lines collapsed to a single one in descriptions
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Distinct descriptions and code snippets whose conversions are kept
+CONVERSION_CACHE_SIZE = 2048
+
+# Problem filenames kept formatted; more than the number of LeetCode problems
+FILENAME_CACHE_SIZE = 8192
+
+# html2text converters keep parser state, so each thread gets its own
+_converters = threading.local()
+
+
+def _html_converter() -> html2text.HTML2Text:
+    """Return the calling thread's html2text converter, configured on first use."""
+    converter = getattr(_converters, "html", None)
+    if converter is None:
+        converter = html2text.HTML2Text()
+        converter.ignore_links = False
+        converter.ignore_images = True
+        converter.body_width = 0  # No wrapping
+        _converters.html = converter
+    return converter
+
 
 class SolutionGenerator:
     """Generate Python solution files for LeetCode problems."""
 
+    # Files generated concurrently by generate_many()
+    GENERATE_WORKERS = 8
+
+    # Solutions directories already created by this process
+    _ensured_dirs: set[Path] = set()
+
     def __init__(self, solutions_dir: str = "LeetCodeSolutions"):
         """
         Initialize the solution generator.
@@ -17,13 +59,9 @@ class SolutionGenerator:
             solutions_dir: Directory where solution files will be created
         """
         self.solutions_dir = Path(solutions_dir)
-        self.solutions_dir.mkdir(exist_ok=True)
-
-        # Configure html2text converter
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
-        self.html_converter.body_width = 0  # No wrapping
+        if self.solutions_dir not in SolutionGenerator._ensured_dirs:
+            self.solutions_dir.mkdir(exist_ok=True)
+            SolutionGenerator._ensured_dirs.add(self.solutions_dir)
 
     def generate_filename(self, problem_id: int, slug: str) -> str:
         """
@@ -36,6 +74,12 @@ class SolutionGenerator:
         Returns:
             Filename in format p{id}_{slug}.py
         """
+        return self._format_filename(problem_id, slug)
+
+    @staticmethod
+    @lru_cache(maxsize=FILENAME_CACHE_SIZE)
+    def _format_filename(problem_id: int, slug: str) -> str:
+        """Build the filename for a problem, cached per (ID, slug)."""
         # Format ID with leading zeros (4 digits)
         formatted_id = f"{problem_id:04d}"
         # Clean slug: replace hyphens with underscores
@@ -46,9 +90,15 @@ class SolutionGenerator:
         """Convert HTML content to plain text."""
         if not html:
             return "No description available"
-        text = self.html_converter.handle(html)
+        return self._convert_html(html)
+
+    @staticmethod
+    @lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+    def _convert_html(html: str) -> str:
+        """Convert non-empty HTML to text, cached per HTML string."""
+        text = _html_converter().handle(html)
         # Clean up excessive newlines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = BLANK_LINES_RE.sub("\n\n", text)
         # Remove trailing whitespace from each line
         lines = text.split('\n')
         text = '\n'.join(line.rstrip() for line in lines)
@@ -64,9 +114,30 @@ class SolutionGenerator:
         Returns:
             Dictionary with function_name and full signature
         """
+        # Copied so callers can't modify the cached result
+        return dict(self._match_signature(code_snippet))
+
+    @staticmethod
+    @lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+    def _match_signature(code_snippet: str) -> dict:
+        """Find the function name and signature in a snippet, cached per snippet."""
+        # Parsing skips the commented-out helper classes ("Definition for
+        # singly-linked list.") that precede many snippets, and __init__
+        # skips the constructor of design problems
+        try:
+            tree = ast.parse(DEF_LINE_RE.sub(r"\1\2\n\1    pass", code_snippet))
+        except SyntaxError:
+            tree = None
+        if tree is not None:
+            for node in ast.walk(tree):
+                if isinstance(node, ast.FunctionDef) and node.name != "__init__":
+                    signature = f"def {node.name}({ast.unparse(node.args)})"
+                    if node.returns:
+                        signature += f" -> {ast.unparse(node.returns)}"
+                    return {"name": node.name, "signature": signature}
+
         # Match function definition
-        pattern = r"def\s+(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:"
-        match = re.search(pattern, code_snippet)
+        match = FUNCTION_DEF_RE.search(code_snippet)
 
         if match:
             full_match = match.group(0).rstrip(":")
@@ -89,34 +160,61 @@ class SolutionGenerator:
         filename = self.generate_filename(problem_data["id"], problem_data["slug"])
         filepath = self.solutions_dir / filename
 
-        # Check if file already exists
-        if filepath.exists():
+        # Exclusive creation checks for an existing file and creates it in one
+        # step; binary mode keeps Unix line endings on every platform
+        try:
+            f = filepath.open("xb")
+        except FileExistsError:
             return filepath
 
-        # Convert HTML content to text
-        description = self.html_to_text(problem_data["content"])
+        try:
+            with f:
+                # Convert HTML content to text
+                description = self.html_to_text(problem_data["content"])
+
+                # Extract function signature
+                func_info = self.extract_function_signature(problem_data["code_snippet"])
+
+                # Get imports from code snippet
+                imports = self._extract_imports(problem_data["code_snippet"])
+
+                # Generate file content
+                content = self._generate_file_content(
+                    problem_data=problem_data,
+                    description=description,
+                    func_info=func_info,
+                    imports=imports,
+                )
+
+                f.write(content.encode("utf-8"))
+        except BaseException:
+            # An empty or partial file would be mistaken for a generated one
+            filepath.unlink(missing_ok=True)
+            raise
+        return filepath
 
-        # Extract function signature
-        func_info = self.extract_function_signature(problem_data["code_snippet"])
+    def generate_many(self, problems: list[dict]) -> list[Path | BaseException]:
+        """
+        Generate solution files for several problems concurrently.
 
-        # Get imports from code snippet
-        imports = self._extract_imports(problem_data["code_snippet"])
+        A problem that fails doesn't stop the others; its exception is
+        returned in place of a path.
 
-        # Generate file content
-        content = self._generate_file_content(
-            problem_data=problem_data,
-            description=description,
-            func_info=func_info,
-            imports=imports,
-        )
+        Args:
+            problems: Problem data from LeetCode API
 
-        # Write file with Unix line endings
-        filepath.write_text(content, encoding="utf-8", newline='\n')
-        return filepath
+        Returns:
+            For each problem, in order, the path to its file or the exception
+            raised while generating it
+        """
+        with ThreadPoolExecutor(max_workers=self.GENERATE_WORKERS) as executor:
+            futures = [executor.submit(self.generate_solution_file, p) for p in problems]
+        return [future.exception() or future.result() for future in futures]
 
     def _extract_imports(self, code_snippet: str) -> list[str]:
         """Extract import statements from code snippet."""
-        if not code_snippet:
+        # Almost no snippet has imports; skip splitting those into lines
+        if not code_snippet or ("import " not in code_snippet and "from " not in code_snippet):
             return []
         imports = []
         for line in code_snippet.split("\n"):
@@ -129,11 +227,13 @@ class SolutionGenerator:
         self, problem_data: dict, description: str, func_info: dict, imports: list[str]
     ) -> str:
         """Generate the complete file content."""
+        # Values ending a line are stripped, so no line of the file ends in
+        # whitespace; the description and imports already come stripped
         problem_id = problem_data["id"]
-        title = problem_data["title"]
+        title = problem_data["title"].rstrip()
         difficulty = problem_data["difficulty"]
-        tags = ", ".join(problem_data["tags"])
-        url = problem_data["url"]
+        tags_line = f"Tags: {', '.join(problem_data['tags'])}".rstrip()
+        url = problem_data["url"].rstrip()
 
         # Build imports section
         imports_section = "\n".join(imports) if imports else "from typing import List"
@@ -142,7 +242,7 @@ class SolutionGenerator:
 LeetCode {problem_id}. {title}
 
 Difficulty: {difficulty}
-Tags: {tags}
+{tags_line}
 
 {description}
 
@@ -183,8 +283,4 @@ if __name__ == "__main__":
 
     print("[!]️  Add your test cases above")
 '''
-
-        # Final cleanup: remove trailing whitespace from all lines
-        lines = template.split('\n')
-        cleaned = '\n'.join(line.rstrip() for line in lines)
-        return cleaned
+        return template